@@ -0,0 +1,57 @@
+/* Optional native copy loop for splitNSP.py (Linux).
+ *
+ * Build with:  cc -O3 -shared -fPIC -o _splitnsp_io.so _splitnsp_io.c
+ *
+ * splitNSP.py loads _splitnsp_io.so from its own directory via ctypes when
+ * present; without it the pure-Python copy paths are used, so building this
+ * is entirely optional.
+ */
+
+#include <errno.h>
+#include <stddef.h>
+#include <stdint.h>
+#include <sys/sendfile.h>
+
+typedef void (*progress_cb)(uint64_t bytes_copied);
+
+#define MAX_SPAN          (16 * 1024 * 1024)
+#define PROGRESS_INTERVAL (16 * 1024 * 1024)
+
+/* Copies count bytes from in_fd's current offset to out_fd's current offset
+ * with sendfile, invoking progress after every ~PROGRESS_INTERVAL bytes.
+ * Returns the number of bytes copied; if nothing could be copied, returns
+ * -errno. On a mid-stream error the partial count is returned instead, so
+ * the caller can resume from the (consistent) file offsets. */
+int64_t splitnsp_copy(int in_fd, int out_fd, uint64_t count, progress_cb progress)
+{
+    uint64_t done = 0;
+    uint64_t since_report = 0;
+
+    while (done < count) {
+        uint64_t span = count - done;
+        if (span > MAX_SPAN)
+            span = MAX_SPAN;
+
+        ssize_t copied = sendfile(out_fd, in_fd, NULL, span);
+        if (copied < 0) {
+            if (errno == EINTR)
+                continue;
+            if (done == 0)
+                return -(int64_t)errno;
+            break;
+        }
+        if (copied == 0)
+            break; /* end of input */
+
+        done += (uint64_t)copied;
+        since_report += (uint64_t)copied;
+        if (progress && since_report >= PROGRESS_INTERVAL) {
+            progress(since_report);
+            since_report = 0;
+        }
+    }
+
+    if (progress && since_report > 0)
+        progress(since_report);
+    return (int64_t)done;
+}
@@ -1,7 +1,6 @@
 from typing import Optional, override
 from dataclasses import dataclass
-from queue import SimpleQueue
-import time
+from collections import deque
 import threading
 
 import splitNSP
@@ -26,6 +25,11 @@ class FileProgressEvent:
     written_bytes: int
     total_bytes: int
 
+@dataclass(slots=True, frozen=True)
+class HashEvent:
+    part_number: int
+    hex_digest: str
+
 @dataclass(slots=True, frozen=True)
 class ArchiveBitEvent:
     error_msg: 'Optional[str]'
@@ -42,35 +46,41 @@ class NormalExitEvent:
 
 
 class QueueSplitReporter(splitNSP.SplitReporter):
-    def __init__(self, queue: SimpleQueue):
+    def __init__(self, queue: deque):
         self.queue = queue
-        self.last_file_progress_time = time.time()
+        self.next_report_bytes = 0
 
     @override
     def report_initial_info(self, total_parts: int, total_bytes: int):
-        self.queue.put_nowait(InitialInfoEvent(total_parts, total_bytes))
+        self.queue.append(InitialInfoEvent(total_parts, total_bytes))
 
     @override
     def report_start_part(self, part_number: int, total_parts: int):
-        self.queue.put_nowait(StartPartEvent(part_number, total_parts))
+        self.queue.append(StartPartEvent(part_number, total_parts))
 
     @override
     def report_finish_part(self, part_number: int, total_parts: int):
-        self.queue.put_nowait(FinishPartEvent(part_number, total_parts))
+        self.queue.append(FinishPartEvent(part_number, total_parts))
 
     @override
     def report_file_progress(self, written_bytes: int, total_bytes: int):
-        curr_time = time.time()
-        if curr_time - self.last_file_progress_time >= 0.13:
-            self.last_file_progress_time = curr_time
-            self.queue.put_nowait(FileProgressEvent(written_bytes, total_bytes))
+        # Throttle on bytes written rather than wall time: one integer compare
+        # instead of a clock read on every callback from the copy loop.
+        # total_bytes // 200 gives ~0.5% progress-bar granularity.
+        if written_bytes >= self.next_report_bytes:
+            self.next_report_bytes = written_bytes + total_bytes // 200
+            self.queue.append(FileProgressEvent(written_bytes, total_bytes))
+
+    @override
+    def report_hash(self, part_number: int, hex_digest: str):
+        self.queue.append(HashEvent(part_number, hex_digest))
 
     @override
     def report_set_archive_bit(self, error_msg: 'Optional[str]'):
-        self.queue.put_nowait(ArchiveBitEvent(error_msg))
+        self.queue.append(ArchiveBitEvent(error_msg))
 
 class SplitterThread(threading.Thread): 
-    def __init__(self, queue: SimpleQueue, input_file_path, output_parent_dir = None):
+    def __init__(self, queue: deque, input_file_path, output_parent_dir = None):
         super().__init__()
         self.queue = queue
 
@@ -86,18 +96,18 @@ class SplitterThread(threading.Thread):
                 input_file_path=self.input_file_path,
                 output_parent_dir=self.output_parent_dir,
                 reporter=split_reporter)
-            self.queue.put_nowait(NormalExitEvent())
+            self.queue.append(NormalExitEvent())
         except BaseException as e:
-            self.queue.put_nowait(ExceptionExitEvent(type(e), str(e), repr(e)))
+            self.queue.append(ExceptionExitEvent(type(e), str(e), repr(e)))
 
 @dataclass()
 class SplitterState:
-    queue: SimpleQueue
+    queue: deque
     thread: SplitterThread
 
-def start_splitter_thread(input_file_path, output_parent_dir = None, queue: SimpleQueue = None) -> SplitterState:
+def start_splitter_thread(input_file_path, output_parent_dir = None, queue: deque = None) -> SplitterState:
     if queue is None:
-        queue = SimpleQueue()
+        queue = deque()
 
     state = SplitterState(queue = queue, thread = SplitterThread(queue, input_file_path, output_parent_dir))
     
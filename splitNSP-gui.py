@@ -2,7 +2,6 @@ import tkinter as tk
 from tkinter import ttk
 import tkinter.filedialog as tkfd
 from pathlib import Path
-import queue
 
 import async_split as aspl
 
@@ -50,10 +49,12 @@ class FilePicker(tk.Frame):
     def curr_file(self):
         return Path(self.file_text.get()).absolute()
 
-def add_periodic_funcion(root: tk.Tk, period, func, /, *args):
+# Calls func repeatedly; func returns truthy to request the fast poll period
+# (events are flowing, keep the UI snappy) and falsy for the idle period
+def add_adaptive_polling(root: tk.Tk, busy_period, idle_period, func, /, *args):
     def poll():
-        func(*args)
-        root.after(period, poll)
+        busy = func(*args)
+        root.after(busy_period if busy else idle_period, poll)
 
     root.after(0, poll)
 
@@ -89,53 +90,76 @@ def main():
             input_file_picker.curr_file(),
             output_dir_picker.curr_file())
 
-    def update_state():
+    def update_state() -> bool:
         nonlocal split_state, progressbar_progress, text_above_progressbar
 
         if split_state is None:
-            return
-        
+            return False
+
+        # Drain everything queued this frame before applying any of it, so bursts
+        # of superseded events can be coalesced into at most one widget update
+        events = []
         while True:
             try:
-                match split_state.queue.get_nowait():
-                    case aspl.InitialInfoEvent(total_parts, total_bytes):
-                        print(f'Splitting NSP of size {total_bytes:,d} bytes into {total_parts} parts...')
-                        text_above_progressbar.set("Splitting")
-                        progressbar_progress.set(0.0)
+                events.append(split_state.queue.popleft())
+            except IndexError:
+                break
 
-                    case aspl.StartPartEvent(part_number, total_parts):
+        if not events:
+            return False
+
+        # Only the newest progress and part-start events matter; each older one
+        # would just repaint the same widgets with already-stale values
+        last_progress_idx = -1
+        last_start_idx = -1
+        for idx, event in enumerate(events):
+            if isinstance(event, aspl.FileProgressEvent):
+                last_progress_idx = idx
+            elif isinstance(event, aspl.StartPartEvent):
+                last_start_idx = idx
+
+        for idx, event in enumerate(events):
+            match event:
+                case aspl.InitialInfoEvent(total_parts, total_bytes):
+                    print(f'Splitting NSP of size {total_bytes:,d} bytes into {total_parts} parts...')
+                    text_above_progressbar.set("Splitting")
+                    progressbar_progress.set(0.0)
+
+                case aspl.StartPartEvent(part_number, total_parts):
+                    if idx == last_start_idx:
                         print(f'Starting part {part_number + 1:02} of {total_parts:02}')
                         text_above_progressbar.set(f"Splitting (part {part_number + 1} of {total_parts})")
 
-                    case aspl.FinishPartEvent(part_number, total_parts):
-                        print(f'Part {part_number + 1:02} of {total_parts:02} complete')
-                    case aspl.FileProgressEvent(written_bytes, total_bytes):
+                case aspl.FinishPartEvent(part_number, total_parts):
+                    print(f'Part {part_number + 1:02} of {total_parts:02} complete')
+                case aspl.FileProgressEvent(written_bytes, total_bytes):
+                    if idx == last_progress_idx:
                         progressbar_progress.set(float(written_bytes) / float(total_bytes))
-                    case aspl.ArchiveBitEvent(error_msg):
-                        if not error_msg:
-                            print('Succesfully set archive bit')
-                        else:
-                            print(f'Could not set archive bit ({error_msg})')
-                        # TODO: Show error popup on error?
-                        pass
-                    case aspl.ExceptionExitEvent(exc_type, exc_str, exc_repr):
-                        print(f"Failed to split ({exc_str})")
-                        text_above_progressbar.set("Failed to split")
-                        split_state = None
-                        break
-                        # TODO: Show error popup on error?
-                    case aspl.NormalExitEvent:
-                        print("Finished splitting")
-                        text_above_progressbar.set("Done")
-                        progressbar_progress.set(1.0)
-                        split_state = None
-                        break
-
-            except queue.Empty:
-                break
-    
-
-    add_periodic_funcion(root, 240, update_state)
+                case aspl.HashEvent(part_number, hex_digest):
+                    print(f'Part {part_number + 1:02} hash: {hex_digest}')
+                case aspl.ArchiveBitEvent(error_msg):
+                    if not error_msg:
+                        print('Succesfully set archive bit')
+                    else:
+                        print(f'Could not set archive bit ({error_msg})')
+                    # TODO: Show error popup on error?
+                    pass
+                case aspl.ExceptionExitEvent(exc_type, exc_str, exc_repr):
+                    print(f"Failed to split ({exc_str})")
+                    text_above_progressbar.set("Failed to split")
+                    split_state = None
+                    break
+                    # TODO: Show error popup on error?
+                case aspl.NormalExitEvent():
+                    print("Finished splitting")
+                    text_above_progressbar.set("Done")
+                    progressbar_progress.set(1.0)
+                    split_state = None
+                    break
+
+        return True
+
+    add_adaptive_polling(root, 30, 240, update_state)
     root.mainloop()
     
 if __name__ == "__main__":
@@ -5,16 +5,50 @@
 # Note: This script can be run stand-alone without any packages installed
 
 import argparse
+import hashlib
 import math
+import mmap
+import multiprocessing
 import os
 import platform
-import re
 import shutil
-import subprocess
 import sys
-import time
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, override
+from queue import Empty, SimpleQueue
+from typing import Callable, Optional, override
+
+# Constants
+
+PART_SIZE = 0xFFFF0000 # 4,294,901,760 bytes
+CHUNK_SIZE = 0x400000 # 4,194,304 bytes
+KERNEL_COPY_SIZE = 0x1000000 # 16,777,216 bytes per kernel-side copy call
+PIPELINE_BUFFER_COUNT = 4 # at most PIPELINE_BUFFER_COUNT * CHUNK_SIZE bytes in flight
+DIRECT_IO_ALIGNMENT = 0x1000 # direct I/O reads must be multiples of the sector size
+FICLONERANGE = 0x4020940D # Linux ioctl: clone a byte range between files (reflink)
+
+# Memoized at import: platform.system() is not free, and its result never changes
+_IS_WINDOWS = platform.system() == 'Windows'
+
+# Loads the optional native copy loop (see _splitnsp_io.c), which fuses the
+# sendfile loop and progress callbacks into compiled code. Purely an accelerator:
+# when the shared library hasn't been built this returns (None, None) and the
+# pure-Python copy paths are used, so the script still runs stand-alone.
+def _load_native_copy():
+    if _IS_WINDOWS:
+        return None, None
+    try:
+        import ctypes
+        lib = ctypes.CDLL(str(Path(__file__).with_name('_splitnsp_io.so')))
+        progress_type = ctypes.CFUNCTYPE(None, ctypes.c_uint64)
+        lib.splitnsp_copy.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_uint64, progress_type]
+        lib.splitnsp_copy.restype = ctypes.c_int64
+        return lib.splitnsp_copy, progress_type
+    except (OSError, AttributeError):
+        return None, None
+
+_native_copy, _native_progress_type = _load_native_copy()
 
 class SplitReporter:
     def report_initial_info(self, total_parts: int, total_bytes: int):
@@ -28,7 +62,10 @@ class SplitReporter:
 
     def report_file_progress(self, written_bytes: int, total_bytes: int):
         pass
-    
+
+    def report_hash(self, part_number: int, hex_digest: str):
+        pass
+
     def report_set_archive_bit(self, error_msg: Optional[str]):
         pass
 
@@ -36,28 +73,319 @@ class SplitReporter:
 def _try_set_archive_bit(folder: Path) -> Optional[str]:
     try:
         p = os.path.realpath(folder)
-        if platform.system == 'Windows':
-            subprocess.run(['attrib', '+a', p], check=True)
+        if _IS_WINDOWS:
+            import ctypes
+            import ctypes.wintypes
+            INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+            GetFileAttributesW = ctypes.windll.kernel32.GetFileAttributesW
+            # Without this the result comes back as a sign-extended c_int and a
+            # failing call would never compare equal to INVALID_FILE_ATTRIBUTES
+            GetFileAttributesW.restype = ctypes.wintypes.DWORD
+            attrs = GetFileAttributesW(p)
+            if attrs == INVALID_FILE_ATTRIBUTES:
+                raise ctypes.WinError()
+            attrs |= 0x20 # FILE_ATTRIBUTE_ARCHIVE
+            if not ctypes.windll.kernel32.SetFileAttributesW(p, attrs):
+                raise ctypes.WinError()
         else:
-            output = subprocess.check_output(['getfattr', '-e', 'hex', '-n', 'system.ntfs_attrib_be', p], 
-                                             text=True,
-                                             stderr=subprocess.DEVNULL)
-            m = re.search(r'^system.ntfs_attrib_be=(0x[0-9a-fA-F]{8})$', output, flags=re.MULTILINE)
-            attrs = int(m.group(1), base=16)
+            # ntfs-3g exposes the NTFS attribute bitmap as a big-endian extended attribute
+            attrs = int.from_bytes(os.getxattr(p, 'system.ntfs_attrib_be'), 'big')
             attrs |= 0x20 # FILE_ATTRIBUTE_ARCHIVE
-            attrs_str = f'0x{attrs:08x}'
-            subprocess.run(['setfattr', '-v', attrs_str, '-n', 'system.ntfs_attrib_be', p], check=True)
+            os.setxattr(p, 'system.ntfs_attrib_be', attrs.to_bytes(4, 'big'))
     except Exception as e:
         return str(e)
 
     return None
 
-def split(*, input_file_path: Path | str, output_parent_dir: Optional[Path | str] = None, reporter: SplitReporter):
+# Opens the input file for unbuffered reading, bypassing the OS page cache when
+# direct_io is requested and the platform/filesystem allows it. A split reads the
+# input exactly once, so caching it only evicts other applications' hot pages.
+# Returns (file, is_direct); callers must use aligned buffers when is_direct.
+def _open_input(path, direct_io: bool):
+    if direct_io:
+        try:
+            if hasattr(os, 'O_DIRECT'):
+                fd = os.open(path, os.O_RDONLY | os.O_DIRECT)
+                return os.fdopen(fd, 'rb', buffering=0), True
+            elif _IS_WINDOWS:
+                import ctypes
+                import msvcrt
+                GENERIC_READ = 0x80000000
+                FILE_SHARE_READ = 0x00000001
+                OPEN_EXISTING = 3
+                FILE_FLAG_NO_BUFFERING = 0x20000000
+                FILE_FLAG_SEQUENTIAL_SCAN = 0x08000000
+                CreateFileW = ctypes.windll.kernel32.CreateFileW
+                CreateFileW.restype = ctypes.c_void_p
+                handle = CreateFileW(str(path), GENERIC_READ, FILE_SHARE_READ, None, OPEN_EXISTING,
+                                     FILE_FLAG_NO_BUFFERING | FILE_FLAG_SEQUENTIAL_SCAN, None)
+                if handle is not None and handle != ctypes.c_void_p(-1).value:
+                    fd = msvcrt.open_osfhandle(handle, os.O_RDONLY)
+                    return os.fdopen(fd, 'rb', buffering=0), True
+        except OSError:
+            # e.g. tmpfs or FUSE filesystems without O_DIRECT support
+            pass
+    return open(path, 'rb', buffering=0), False
+
+# Advises the kernel about our access pattern on a byte range of fd. The advice is
+# named rather than passed as a value so this stays a no-op on platforms without
+# posix_fadvise (Windows). Purely a hint; failures are ignored.
+def _fadvise(fd: int, offset: int, length: int, advice_name: str):
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, offset, length, getattr(os, advice_name))
+        except OSError:
+            pass
+
+# Allocates the reusable scratch buffers for the chunked copy path. Direct I/O
+# requires page-aligned buffers, which anonymous mmaps are; bytearrays are not.
+def _make_copy_buffers(direct: bool) -> 'list[memoryview]':
+    if direct:
+        return [memoryview(mmap.mmap(-1, CHUNK_SIZE)) for _ in range(PIPELINE_BUFFER_COUNT)]
+    return [memoryview(bytearray(CHUNK_SIZE)) for _ in range(PIPELINE_BUFFER_COUNT)]
+
+# Attempts to "copy" count bytes from in_fd at offset into out_fd by cloning the
+# byte range: on copy-on-write filesystems (btrfs, XFS with reflink=1) the new file
+# just shares the input's extents and no data moves at all, making the part
+# near-instantaneous. Returns True on success; any failure (different filesystem,
+# no reflink support, not Linux) means the caller should copy normally.
+def _try_reflink_part(in_fd: int, out_fd: int, offset: int, count: int) -> bool:
+    try:
+        import fcntl
+        import struct
+        # Cloned ranges must be block-aligned (PART_SIZE is) or extend to the end
+        # of the source; a length of 0 means "through end-of-file", which also
+        # covers the final part's unaligned tail
+        if offset + count == os.fstat(in_fd).st_size:
+            count = 0
+        # struct file_clone_range: s64 src_fd, u64 src_offset, u64 src_length, u64 dest_offset
+        fcntl.ioctl(out_fd, FICLONERANGE, struct.pack('=qQQQ', in_fd, offset, count, 0))
+        return True
+    except (ImportError, OSError):
+        return False
+
+FALLOC_FL_KEEP_SIZE = 0x01 # fallocate(2): reserve space without changing the file size
+
+# Makes a best-effort to reserve size bytes for the open file up front. One allocation
+# per part avoids thousands of incremental metadata updates while writing and reduces
+# fragmentation; filesystems without support are silently skipped.
+#
+# On Linux this calls fallocate(2) directly rather than posix_fallocate: when the
+# filesystem lacks unwritten extents, the glibc wrapper (and FAT's mode-0 fallocate)
+# "succeeds" by physically zero-filling the range, which would write every part
+# twice on the FAT32/exFAT cards this tool targets. FALLOC_FL_KEEP_SIZE genuinely
+# fails with EOPNOTSUPP instead of degrading to writes.
+def _try_preallocate(fd: int, size: int):
+    try:
+        if sys.platform == 'linux':
+            import ctypes
+            libc = ctypes.CDLL(None, use_errno=True)
+            libc.fallocate.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_longlong,
+                                       ctypes.c_longlong]
+            libc.fallocate(fd, FALLOC_FL_KEEP_SIZE, 0, size)
+        elif _IS_WINDOWS:
+            import ctypes
+            import msvcrt
+            handle = msvcrt.get_osfhandle(fd)
+            distance = ctypes.c_longlong(size)
+            if ctypes.windll.kernel32.SetFilePointerEx(handle, distance, None, 0): # FILE_BEGIN
+                ctypes.windll.kernel32.SetEndOfFile(handle)
+                # Restore the pointer even if SetEndOfFile failed; leaving it at
+                # size would put the part's data after a span of zeros
+                ctypes.windll.kernel32.SetFilePointerEx(handle, ctypes.c_longlong(0), None, 0)
+    except (OSError, AttributeError):
+        pass
+
+# Chunked copy through user space with reads and writes overlapped on two threads.
+# file.readinto/write release the GIL, so when the source and destination are on
+# different physical devices this keeps both busy at once. buffers is a pool of
+# reusable scratch buffers (memoryviews) cycled between the two threads.
+def _copy_chunked_pipelined(in_file, out_file, count: int, progress: 'Callable[[int], None]',
+                            buffers: 'list[memoryview]', align_reads: bool = False, hasher = None):
+    free_bufs = SimpleQueue() # buffers ready for the reader to fill (None = stop reading)
+    for buf in buffers:
+        free_bufs.put_nowait(buf)
+    filled_bufs = SimpleQueue() # (buf, length) ready to write (None = end of input)
+
+    def read_worker():
+        remaining = count
+        try:
+            while remaining > 0:
+                buf = free_bufs.get()
+                if buf is None:
+                    return
+                span = min(len(buf), remaining)
+                if align_reads and span % DIRECT_IO_ALIGNMENT != 0:
+                    # Direct I/O rejects unaligned read lengths. An unaligned span only
+                    # occurs for the final chunk before end-of-file (PART_SIZE and
+                    # CHUNK_SIZE are both sector multiples), so rounding the request up
+                    # just yields a short read at EOF rather than stealing bytes from
+                    # a following part.
+                    span = min(len(buf), (span + DIRECT_IO_ALIGNMENT - 1) & -DIRECT_IO_ALIGNMENT)
+                copied = in_file.readinto(buf[:span])
+                if not copied:
+                    break
+                remaining -= copied
+                filled_bufs.put_nowait((buf, copied))
+        except BaseException as e:
+            filled_bufs.put_nowait(e)
+            return
+        filled_bufs.put_nowait(None)
+
+    reader = threading.Thread(target=read_worker, daemon=True)
+    reader.start()
+    try:
+        while True:
+            item = filled_bufs.get()
+            if item is None:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            buf, length = item
+            out_file.write(buf[:length])
+            if hasher is not None:
+                # hashlib releases the GIL for buffers this large, so this
+                # overlaps with the reader thread just like the write does
+                hasher.update(buf[:length])
+            progress(length)
+            free_bufs.put_nowait(buf)
+    finally:
+        # Unblock the reader in case the writer bailed out early
+        free_bufs.put_nowait(None)
+        reader.join()
+
+# Copies count bytes from the current position of in_file to the current position of out_file,
+# calling progress(n) after every n bytes copied. buffers is a pool of reusable scratch
+# buffers (memoryviews over at least CHUNK_SIZE bytes) for the fallback path. When a
+# hasher is given it is updated with every copied byte; that requires the bytes in user
+# space, so the zero-copy paths are skipped.
+def _copy_part(in_file, out_file, count: int, progress: 'Callable[[int], None]',
+               buffers: 'list[memoryview]', align_reads: bool = False, hasher = None):
+    remaining = count
+
+    if hasher is not None:
+        _copy_chunked_pipelined(in_file, out_file, remaining, progress, buffers, align_reads, hasher)
+        return
+
+    # Fastest path: the whole sendfile loop, progress callbacks included, runs in
+    # compiled code. On a mid-stream error it returns the partial count with the
+    # file offsets left consistent, so the paths below can finish the remainder.
+    if _native_copy is not None and remaining > 0:
+        copied = _native_copy(in_file.fileno(), out_file.fileno(), remaining,
+                              _native_progress_type(progress))
+        if copied > 0:
+            remaining -= copied
+        if remaining == 0:
+            return
+
+    # Fast path: let the kernel move the bytes directly between the two files,
+    # avoiding a round-trip through a Python bytes object for every chunk.
+    # Both calls may copy less than requested, so we loop until done.
+    try:
+        while remaining > 0:
+            span = min(remaining, KERNEL_COPY_SIZE)
+            if hasattr(os, 'copy_file_range'):
+                copied = os.copy_file_range(in_file.fileno(), out_file.fileno(), span)
+            elif hasattr(os, 'sendfile'):
+                copied = os.sendfile(out_file.fileno(), in_file.fileno(), None, span)
+            else:
+                break
+            if copied == 0:
+                break
+            remaining -= copied
+            progress(copied)
+    except OSError:
+        # Not supported for these files (e.g. EINVAL on some filesystems).
+        # The file offsets are only advanced on success, so we can finish
+        # whatever is left with the plain read/write loop below.
+        pass
 
-    # Constants
+    # Fallback path: pipelined chunked copy through user space
+    if remaining > 0:
+        _copy_chunked_pipelined(in_file, out_file, remaining, progress, buffers, align_reads)
+
+# Copies one part in a worker process. Each part is an independent byte range of the
+# input, so workers just reopen the input and seek. Events are reported back as
+# (kind, part_number, payload) tuples on progress_queue for the parent to forward.
+def _split_part_worker(input_file_path: Path, output_path: Path, offset: int, count: int,
+                       part_number: int, progress_queue, direct_io: bool,
+                       hash_alg: Optional[str], may_reflink: bool):
+    progress_queue.put(('start', part_number, 0))
+    in_file, is_direct = _open_input(input_file_path, direct_io)
+    buffers = _make_copy_buffers(is_direct)
+    hasher = hashlib.new(hash_alg) if hash_alg is not None else None
+    with in_file:
+        if not is_direct:
+            _fadvise(in_file.fileno(), offset, count, 'POSIX_FADV_SEQUENTIAL')
+            _fadvise(in_file.fileno(), offset, count, 'POSIX_FADV_WILLNEED')
+        in_file.seek(offset)
+        with open(output_path, 'wb', buffering=0) as out_file:
+            if may_reflink and hasher is None and _try_reflink_part(
+                    in_file.fileno(), out_file.fileno(), offset, count):
+                progress_queue.put(('progress', part_number, count))
+            else:
+                _try_preallocate(out_file.fileno(), count)
+                _copy_part(in_file, out_file, count,
+                           lambda copied: progress_queue.put(('progress', part_number, copied)),
+                           buffers, is_direct, hasher)
+        if not is_direct:
+            _fadvise(in_file.fileno(), offset, count, 'POSIX_FADV_DONTNEED')
+    if hasher is not None:
+        progress_queue.put(('hash', part_number, hasher.hexdigest()))
+    progress_queue.put(('finish', part_number, 0))
+
+# Splits into parts using a pool of worker processes, aggregating their progress
+# events for the reporter. Only pays off when the source and destination are on
+# different physical devices; the caller chooses via parallel_parts.
+def _split_parallel(input_file_path: Path, output_dir: Path, input_file_size: int,
+                    total_parts: int, reporter: SplitReporter, max_workers: int,
+                    direct_io: bool, hash_alg: Optional[str], may_reflink: bool):
+    total_written = 0
+    with multiprocessing.Manager() as manager:
+        progress_queue = manager.Queue()
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(_split_part_worker,
+                                   input_file_path,
+                                   output_dir / f'{i:02}',
+                                   i * PART_SIZE,
+                                   min(PART_SIZE, input_file_size - i * PART_SIZE),
+                                   i,
+                                   progress_queue,
+                                   direct_io,
+                                   hash_alg,
+                                   may_reflink)
+                       for i in range(total_parts)]
+
+            finished_parts = 0
+            while finished_parts < total_parts:
+                try:
+                    kind, part_number, payload = progress_queue.get(timeout=0.25)
+                except Empty:
+                    # A failed worker never sends its 'finish' event; surface its error
+                    for future in futures:
+                        if future.done() and future.exception() is not None:
+                            # Cancel the queued parts before raising; the executor's
+                            # __exit__ would otherwise copy every remaining part to
+                            # completion before the error reached the caller
+                            for remaining in futures:
+                                remaining.cancel()
+                            raise future.exception()
+                    continue
+
+                if kind == 'start':
+                    reporter.report_start_part(part_number, total_parts)
+                elif kind == 'progress':
+                    total_written += payload
+                    reporter.report_file_progress(total_written, input_file_size)
+                elif kind == 'hash':
+                    reporter.report_hash(part_number, payload)
+                else: # 'finish'
+                    finished_parts += 1
+                    reporter.report_finish_part(part_number, total_parts)
 
-    PART_SIZE = 0xFFFF0000 # 4,294,901,760 bytes
-    CHUNK_SIZE = 0x8000 # 32,768 bytes
+def split(*, input_file_path: Path | str, output_parent_dir: Optional[Path | str] = None,
+          reporter: SplitReporter, parallel_parts: int = 1, direct_io: bool = False,
+          hash_alg: Optional[str] = None):
 
     # Argument parsing
 
@@ -80,13 +408,16 @@ def split(*, input_file_path: Path | str, output_parent_dir: Optional[Path | str
     else:
         if not output_dir.is_dir():
             raise ValueError(f'{output_dir} is not a folder')
-        elif not (len(os.listdir(output_dir)) == 0):
-            raise ValueError(f'{output_dir} is not empty')
+        else:
+            # scandir stops at the first entry instead of materializing the whole listing
+            with os.scandir(output_dir) as entries:
+                if next(entries, None) is not None:
+                    raise ValueError(f'{output_dir} is not empty')
 
     # Implementation
 
-    input_file_size = os.path.getsize(input_file_path)
-    info = shutil.disk_usage(os.path.dirname(os.path.abspath(input_file_path)))
+    input_file_size = input_file_path.stat().st_size
+    info = shutil.disk_usage(input_file_path.resolve().parent)
     if info.free < input_file_size * 2:
         raise ValueError('Not enough free space to run. Will require twice the space as the NSP file')
 
@@ -97,28 +428,66 @@ def split(*, input_file_path: Path | str, output_parent_dir: Optional[Path | str
 
     reporter.report_initial_info(total_parts, input_file_size)
 
-    # Open source file and begin writing to output files stoping at PART_SIZE
-    total_written = 0
-    with open(input_file_path, 'rb') as in_file:
-        for i in range(total_parts):
-            reporter.report_start_part(i, total_parts)
-            this_part_size = min(PART_SIZE, input_file_size - total_written)
-            this_part_written = 0
-            with open(output_dir / f'{i:02}', 'wb') as out_file:
-                while this_part_written < this_part_size:
-                    this_chunk_size = min(CHUNK_SIZE, this_part_size - this_part_written)
-                    out_file.write(in_file.read(this_chunk_size))
-                    this_part_written += this_chunk_size
-                    total_written += this_chunk_size
-                    reporter.report_file_progress(total_written, input_file_size)
-            reporter.report_finish_part(i, total_parts)
+    # Reflinking is only possible within one filesystem, and pointless when the
+    # bytes are needed in user space anyway for hashing
+    may_reflink = hash_alg is None and input_file_path.stat().st_dev == output_dir.stat().st_dev
+
+    if parallel_parts > 1:
+        _split_parallel(input_file_path, output_dir, input_file_size, total_parts,
+                        reporter, min(parallel_parts, total_parts), direct_io, hash_alg,
+                        may_reflink)
+    else:
+        # Open source file and begin writing to output files stoping at PART_SIZE.
+        # buffering=0 skips Python's BufferedReader/BufferedWriter layer, which would
+        # only add an extra memcpy between our chunk-sized I/O and the OS page cache.
+        total_written = 0
+        # Format every part path up front instead of building one per iteration
+        output_dir_str = os.fspath(output_dir)
+        part_paths = [f'{output_dir_str}{os.sep}{i:02}' for i in range(total_parts)]
+        in_file, is_direct = _open_input(input_file_path, direct_io)
+        copy_buffers = _make_copy_buffers(is_direct)
+        with in_file:
+            # Tell the kernel this is a single sequential pass so it reads ahead
+            # aggressively, and afterwards that the pages won't be needed again
+            # so the user's RAM is given back immediately
+            if not is_direct:
+                _fadvise(in_file.fileno(), 0, 0, 'POSIX_FADV_SEQUENTIAL')
+                _fadvise(in_file.fileno(), 0, 0, 'POSIX_FADV_WILLNEED')
+            for i in range(total_parts):
+                reporter.report_start_part(i, total_parts)
+                this_part_size = min(PART_SIZE, input_file_size - total_written)
+                with open(part_paths[i], 'wb', buffering=0) as out_file:
+                    hasher = None
+                    if may_reflink and _try_reflink_part(in_file.fileno(), out_file.fileno(),
+                                                         total_written, this_part_size):
+                        # The clone doesn't consume the input's file offset, so skip
+                        # past the cloned range for any parts that fall back to copying
+                        in_file.seek(total_written + this_part_size)
+                        total_written += this_part_size
+                        reporter.report_file_progress(total_written, input_file_size)
+                    else:
+                        _try_preallocate(out_file.fileno(), this_part_size)
+                        def on_progress(copied: int):
+                            nonlocal total_written
+                            total_written += copied
+                            reporter.report_file_progress(total_written, input_file_size)
+                        hasher = hashlib.new(hash_alg) if hash_alg is not None else None
+                        _copy_part(in_file, out_file, this_part_size, on_progress, copy_buffers,
+                                   is_direct, hasher)
+                if hasher is not None:
+                    reporter.report_hash(i, hasher.hexdigest())
+                reporter.report_finish_part(i, total_parts)
+            if not is_direct:
+                _fadvise(in_file.fileno(), 0, 0, 'POSIX_FADV_DONTNEED')
 
     reporter.report_set_archive_bit(_try_set_archive_bit(output_dir))
 
 class _ProgressBarSplitReporter(SplitReporter):
     def __init__(self):
         self.last_line_length = 0
-        self.last_print_time = time.time()
+        self.next_report_bytes = 0
+        self._total_string = ''
+        self._total_width = 0
 
     def _printmsg(self, msg: str, end: str = '\n'):
         print(f'{msg:<{self.last_line_length}}', end = end)
@@ -126,7 +495,10 @@ class _ProgressBarSplitReporter(SplitReporter):
 
     @override
     def report_initial_info(self, total_parts: int, total_bytes: int):
-        self._printmsg(f'Splitting NSP of size {total_bytes:,d} bytes into {total_parts} parts...')
+        # total_bytes never changes after this point, so format it once here
+        self._total_string = f'{total_bytes:,d}'
+        self._total_width = len(self._total_string)
+        self._printmsg(f'Splitting NSP of size {self._total_string} bytes into {total_parts} parts...')
 
     @override
     def report_start_part(self, part_number: int, total_parts: int):
@@ -138,21 +510,24 @@ class _ProgressBarSplitReporter(SplitReporter):
 
     @override
     def report_file_progress(self, written_bytes: int, total_bytes: int):
-        curr_time = time.time()
-        if curr_time - self.last_print_time < 0.05:
+        # Throttle on bytes written (~0.5% granularity) rather than wall time,
+        # avoiding a clock read on every callback from the copy loop
+        if written_bytes < self.next_report_bytes:
             return
 
-        self.last_print_time = curr_time
+        self.next_report_bytes = written_bytes + total_bytes // 200
 
-        total_string = f'{total_bytes:,d}'
-        written_string = f'{written_bytes:{len(total_string)},d}'
-        msg = f'   {written_string} / {total_string} bytes'
+        msg = f'   {written_bytes:{self._total_width},d} / {self._total_string} bytes'
         this_line_length = len(msg)
 
         self._printmsg(msg, end='\r')
 
         self.last_line_length = this_line_length
 
+    @override
+    def report_hash(self, part_number: int, hex_digest: str):
+        self._printmsg(f'Part {part_number + 1:02} hash: {hex_digest}')
+
     @override
     def report_set_archive_bit(self, error_msg: Optional[str]):
         if not error_msg:
@@ -167,15 +542,32 @@ def _main():
     # Arg parser for program options
     parser = argparse.ArgumentParser(description='Split NSP/XCI files into FAT32 compatible sizes')
     parser.add_argument('input_file_path', help='Path to NSP or XCI file')
-    parser.add_argument('-o', '--output-parent-dir', type=str, default=None, 
+    parser.add_argument('-o', '--output-parent-dir', type=str, default=None,
                         help='The directory in which to create the _split.nsp folder')
+    parser.add_argument('-j', '--parallel-parts', type=int, default=1,
+                        help='Number of parts to write in parallel (worker processes); '
+                             'only helps when input and output are on different devices')
+    parser.add_argument('--hash', type=str, default=None, metavar='ALG',
+                        # shake_* have no fixed digest size and their hexdigest()
+                        # requires a length argument, so they can't be used here
+                        choices=sorted(a for a in hashlib.algorithms_guaranteed
+                                       if not a.startswith('shake_')),
+                        help='Also compute a hash of each part (e.g. sha256) while '
+                             'splitting, avoiding a second full read to verify')
+    parser.add_argument('--direct-io', action='store_true',
+                        help='Read the input bypassing the OS page cache (O_DIRECT); '
+                             'avoids evicting other applications\' cached data but can '
+                             'hurt throughput on slow HDDs')
 
     args = parser.parse_args()
 
     try:
         split(input_file_path = args.input_file_path,
             output_parent_dir = args.output_parent_dir,
-            reporter=_ProgressBarSplitReporter())
+            reporter=_ProgressBarSplitReporter(),
+            parallel_parts = args.parallel_parts,
+            direct_io = args.direct_io,
+            hash_alg = args.hash)
     except Exception as e:
         print(e)
         return 1